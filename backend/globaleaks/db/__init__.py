@@ -9,7 +9,7 @@ from sqlalchemy.exc import SAWarning
 from globaleaks import models, DATABASE_VERSION
 from globaleaks.handlers.admin.https import db_load_tls_configs
 from globaleaks.models import Base, Config
-from globaleaks.models.config_desc import ConfigFilters
+from globaleaks.models.config_desc import ConfigFilterSets
 from globaleaks.orm import get_engine, get_session, make_db_uri, transact, transact_sync
 from globaleaks.settings import Settings
 from globaleaks.state import State, TenantState
@@ -53,6 +53,17 @@ def create_db():
     Base.metadata.create_all(engine)
 
 
+def create_missing_indexes():
+    """
+    Utility function to create the indexes declared by the models that
+    are missing in an existing database of the current version
+    """
+    engine = get_engine(orm_lockdown=False)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
 def compact_db():
     """
     Execute VACUUM command to deallocate database space
@@ -94,6 +105,7 @@ def update_db():
                 migration.perform_migration(db_version)
             else:
                 migration.perform_data_update(db_file_path)
+                create_missing_indexes()
                 compact_db()
 
     except Exception as exception:
@@ -108,24 +120,24 @@ def update_db():
 
 def db_get_tracked_files(session):
     """
-    Transaction for retrieving the list of files tracked by the application database
+    Transaction for retrieving the set of files tracked by the application database
     :param session: An ORM session
-    :return: The list of filenames of the files
+    :return: The set of filenames of the files
     """
-    return [x[0] for x in session.query(models.File.id)]
+    return {x[0] for x in session.query(models.File.id)}
 
 
 def db_get_tracked_attachments(session):
     """
-    Transaction for retrieving the list of attachment files tracked by the application database
+    Transaction for retrieving the set of attachment files tracked by the application database
     :param session: An ORM session
-    :return: The list of filenames of the attachment files
+    :return: The set of filenames of the attachment files
     """
-    ifiles = session.query(models.InternalFile.id).all()
-    wbfiles = session.query(models.WhistleblowerFile.id).all()
-    rfiles = session.query(models.ReceiverFile.id).all()
+    ret = set()
+    for model in (models.InternalFile, models.WhistleblowerFile, models.ReceiverFile):
+        ret.update(x[0] for x in session.query(model.id))
 
-    return [x[0] for x in ifiles + wbfiles + rfiles]
+    return ret
 
 
 @transact_sync
@@ -212,14 +224,15 @@ def db_refresh_tenant_cache(session, to_refresh=None):
                             .filter(models.EnabledLanguage.tid.in_(tids)):
         State.tenants[tid].cache['languages_enabled'].append(lang)
 
+    node_keys = ConfigFilterSets['node'] | {'https_cert', 'tor_onion_key'}
+    notification_keys = ConfigFilterSets['notification']
+
     for cfg in session.query(Config).filter(Config.tid.in_(tids)):
         tenant_cache = State.tenants[cfg.tid].cache
 
-        if cfg.var_name in ['https_cert', 'tor_onion_key']:
-            tenant_cache[cfg.var_name] = cfg.value
-        elif cfg.var_name in ConfigFilters['node']:
+        if cfg.var_name in node_keys:
             tenant_cache[cfg.var_name] = cfg.value
-        elif cfg.var_name in ConfigFilters['notification']:
+        elif cfg.var_name in notification_keys:
             tenant_cache['notification'][cfg.var_name] = cfg.value
 
     for tid, mail, pub_key in session.query(models.User.tid, models.User.mail_address, models.User.pgp_key_public) \
@@ -55,15 +55,14 @@ class MigrationBase(object):
         pass
 
     def generic_migration_function(self, model_name):
-        for old_obj in self.session_old.query(self.model_from[model_name]):
-            new_obj = self.model_to[model_name]()
-
-            for key in [c.key for c in self.model_to[model_name].__table__.columns]:
-                old_key = key
+        model_to = self.model_to[model_name]
+        renamed_attrs = self.renamed_attrs.get(model_name, {})
+        keys = [(key, renamed_attrs.get(key, key)) for key in model_to._column_names]
 
-                if model_name in self.renamed_attrs and key in self.renamed_attrs[model_name]:
-                    old_key = self.renamed_attrs[model_name][key]
+        for old_obj in self.session_old.query(self.model_from[model_name]):
+            new_obj = model_to()
 
+            for key, old_key in keys:
                 if hasattr(old_obj, old_key):
                     setattr(new_obj, key, getattr(old_obj, old_key))
 
@@ -2,25 +2,24 @@
 from globaleaks import models
 from globaleaks.handlers.base import BaseHandler
 from globaleaks.handlers.operation import OperationHandler
+from globaleaks.handlers.public import db_prepare_contexts_serialization
 from globaleaks.models import fill_localized_keys, get_localized_values
 from globaleaks.orm import db_add, db_del, db_get, transact, tw
 from globaleaks.rest import requests, errors
 
 
-def admin_serialize_context(session, context, language):
+def admin_serialize_context(session, context, language, data=None):
     """
     Serialize the specified context
 
     :param session: the session on which perform queries
     :param context: The object to be serialized
     :param language: the language in which to localize data.
+    :param data: The dictionary of prefetched resources
     :return: a dictionary representing the serialization of the context.
     """
-    receivers = [r[0] for r in session.query(models.ReceiverContext.receiver_id)
-                                      .filter(models.ReceiverContext.context_id == context.id)
-                                      .order_by(models.ReceiverContext.order)]
-
-    picture = session.query(models.File).filter(models.File.name == context.id).one_or_none() is not None
+    if data is None:
+        data = db_prepare_contexts_serialization(session, [context])
 
     ret = {
         'id': context.id,
@@ -39,8 +38,8 @@ def admin_serialize_context(session, context, language):
         'show_steps_navigation_interface': context.show_steps_navigation_interface,
         'questionnaire_id': context.questionnaire_id,
         'additional_questionnaire_id': context.additional_questionnaire_id,
-        'receivers': receivers,
-        'picture': picture
+        'receivers': data['receivers'].get(context.id, []),
+        'picture': data['imgs'].get(context.id, False)
     }
 
     return get_localized_values(ret, context, context.localized_keys, language)
@@ -58,9 +57,11 @@ def get_contexts(session, tid, language):
     """
     contexts = session.query(models.Context) \
                       .filter(models.Context.tid == tid) \
-                      .order_by(models.Context.order)
+                      .order_by(models.Context.order).all()
+
+    data = db_prepare_contexts_serialization(session, contexts)
 
-    return [admin_serialize_context(session, context, language) for context in contexts]
+    return [admin_serialize_context(session, context, language, data) for context in contexts]
 
 
 def db_associate_context_receivers(session, context, receiver_ids):
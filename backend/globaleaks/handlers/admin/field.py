@@ -5,7 +5,7 @@ from globaleaks import models
 from globaleaks.handlers.base import BaseHandler
 from globaleaks.handlers.public import serialize_field, trigger_map
 from globaleaks.models import fill_localized_keys
-from globaleaks.orm import db_add, db_get, db_del, transact, tw
+from globaleaks.orm import db_add, db_add_all, db_get, db_del, transact, tw
 from globaleaks.rest import errors, requests
 from globaleaks.settings import Settings
 from globaleaks.utils.fs import read_json_file
@@ -53,53 +53,37 @@ def db_reset_option_triggers(session, type, object_id):
     db_del(session, m, m.object_id == object_id)
 
 
-def db_update_fieldoption(session, field_id, fieldoption_id, option_dict, language, idx):
+def db_update_fieldoptions(session, field_id, options, language):
     """
-    Transaction to update a field option
+    Transaction to update a set of options at once
 
     :param session: An ORM session
-    :param field_id: The field ID of the field on which the option is set
-    :param fieldoption_id: The option ID
-    :param option_dict: The option configuration
+    :param field_id: The field on which the options are set
+    :param options: The list of options to be updated
     :param language: The language of the request
-    :param idx: The order index with reference to the other options set
-    :return: The serialized descriptor of the option
     """
-    option_dict['fieldoption_id'] = fieldoption_id
-    option_dict['field_id'] = field_id
-    option_dict['idx'] = idx
-
-    fill_localized_keys(option_dict, models.FieldOption.localized_keys, language)
-
-    o = None
-    if fieldoption_id is not None:
-        o = session.query(models.FieldOption) \
-                   .filter(models.FieldOption.id == fieldoption_id,
-                           models.FieldOption.field_id == field_id).one_or_none()
+    if not options:
+        return
 
-    if o is None:
-        o = db_add(session, models.FieldOption, option_dict)
-    else:
-        o.update(option_dict)
+    current = {o.id: o for o in session.query(models.FieldOption).filter(models.FieldOption.field_id == field_id)}
 
-    o.order = idx
+    options_ids = []
+    new_options = []
 
-    return o.id
+    for idx, option_dict in enumerate(options):
+        option_dict['field_id'] = field_id
+        option_dict['order'] = idx
 
+        fill_localized_keys(option_dict, models.FieldOption.localized_keys, language)
 
-def db_update_fieldoptions(session, field_id, options, language):
-    """
-    Transaction to update a set of options at once
-
-    :param session: An ORM session
-    :param field_id: The field on which the options are set
-    :param options: The list of options to be updated
-    :param language: The language of the request
-    """
-    options_ids = [db_update_fieldoption(session, field_id, option['id'], option, language, idx) for idx, option in enumerate(options)]
+        o = current.get(option_dict['id'])
+        if o is None:
+            new_options.append(option_dict)
+        else:
+            o.update(option_dict)
+            options_ids.append(o.id)
 
-    if not options_ids:
-        return
+    options_ids.extend(o.id for o in db_add_all(session, models.FieldOption, new_options))
 
     subquery = session.query(models.FieldOption.id) \
                       .filter(models.FieldOption.field_id == field_id,
@@ -111,52 +95,40 @@ def db_update_fieldoptions(session, field_id, options, language):
            models.FieldOption.id.in_(subquery))
 
 
-def db_update_fieldattr(session, field_id, attr_name, attr_dict, language):
+def db_update_fieldattrs(session, field_id, field_attrs, language):
     """
-    Transaction for updating a fieldattr
+    Transaction to update a set of fieldattrs at once
 
     :param session: An ORM session
-    :param field_id: The field on which the attribute is configured
-    :param attr_name: The attribute name
-    :param attr_dict: The attribute configuration
+    :param field_id: The field on which the fieldattrs are set
+    :param field_attrs: The list of fieldattrs to be updated
     :param language: The language of the request
-    :return: The ID of the attribute
     """
-    attr_dict['name'] = attr_name
-    attr_dict['field_id'] = field_id
-
-    if attr_dict['type'] == 'localized' and language is not None:
-        fill_localized_keys(attr_dict, ['value'], language)
-
-    o = session.query(models.FieldAttr) \
-               .filter(models.FieldAttr.field_id == field_id,
-                       models.FieldAttr.name == attr_name).one_or_none()
+    if not field_attrs:
+        return
 
-    if o is None:
-        o = db_add(session, models.FieldAttr, attr_dict)
-    else:
-        o.update(attr_dict)
+    current = {o.name: o for o in session.query(models.FieldAttr).filter(models.FieldAttr.field_id == field_id)}
 
-    return o.name
+    new_attrs = []
 
+    for attr_name, attr_dict in field_attrs.items():
+        attr_dict['name'] = attr_name
+        attr_dict['field_id'] = field_id
 
-def db_update_fieldattrs(session, field_id, field_attrs, language):
-    """
-    Transaction to update a set of fieldattrs at once
+        if attr_dict['type'] == 'localized' and language is not None:
+            fill_localized_keys(attr_dict, ['value'], language)
 
-    :param session: An ORM session
-    :param field_id: The field on which the fieldattrs are set
-    :param field_attrs: The list of fieldattrs to be updated
-    :param language: The language of the request
-    """
-    attrs_names = [db_update_fieldattr(session, field_id, attr_name, attr, language) for attr_name, attr in field_attrs.items()]
+        o = current.get(attr_name)
+        if o is None:
+            new_attrs.append(attr_dict)
+        else:
+            o.update(attr_dict)
 
-    if not attrs_names:
-        return
+    db_add_all(session, models.FieldAttr, new_attrs)
 
     session.query(models.FieldAttr) \
            .filter(models.FieldAttr.field_id == field_id,
-                   not_(models.FieldAttr.name.in_(attrs_names))) \
+                   not_(models.FieldAttr.name.in_(list(field_attrs)))) \
            .delete(synchronize_session=False)
 
 
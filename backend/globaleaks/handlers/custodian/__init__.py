@@ -21,14 +21,16 @@ from globaleaks.utils.utility import datetime_now
 def get_identityaccessrequest_list(session, tid, user_id, user_key):
     ret = []
 
-    for iarc, iar in session.query(models.IdentityAccessRequestCustodian, models.IdentityAccessRequest) \
-                            .filter(models.IdentityAccessRequestCustodian.identityaccessrequest_id == models.IdentityAccessRequest.id,
-                                    models.IdentityAccessRequestCustodian.custodian_id == user_id,
-                                    models.IdentityAccessRequest.internaltip_id == models.InternalTip.id,
-                                    models.InternalTip.tid == tid) \
-                            .order_by(models.IdentityAccessRequest.request_date.desc()):
-        elem = serializers.serialize_identityaccessrequest(session, iar)
+    results = session.query(models.IdentityAccessRequestCustodian, models.IdentityAccessRequest) \
+                     .filter(models.IdentityAccessRequestCustodian.identityaccessrequest_id == models.IdentityAccessRequest.id,
+                             models.IdentityAccessRequestCustodian.custodian_id == user_id,
+                             models.IdentityAccessRequest.internaltip_id == models.InternalTip.id,
+                             models.InternalTip.tid == tid) \
+                     .order_by(models.IdentityAccessRequest.request_date.desc()).all()
 
+    elems = serializers.serialize_identityaccessrequests(session, [iar for _, iar in results])
+
+    for (iarc, _), elem in zip(results, elems):
         if iarc.crypto_tip_prv_key:
             crypto_tip_prv_key = GCE.asymmetric_decrypt(user_key, base64.b64decode(iarc.crypto_tip_prv_key))
 
@@ -3,6 +3,8 @@
 # Handlers dealing with download of texts translations and customizations
 import os
 
+from functools import lru_cache
+
 from globaleaks import models
 from globaleaks.handlers.base import BaseHandler
 from globaleaks.models.config import ConfigFactory
@@ -21,6 +23,19 @@ def langfile_path(lang):
     return os.path.abspath(os.path.join(Settings.client_path, 'data', 'l10n', '%s.json' % lang))
 
 
+@lru_cache(maxsize=None)
+def read_langfile(path):
+    """
+    Function that returns the parsed content of a language file
+
+    The language files are static assets, so they are parsed once per process
+
+    :param path: The file path of the language file
+    :return: The dictionary of texts of the language
+    """
+    return read_json_file(path)
+
+
 @transact
 def get_l10n(session, tid, lang):
     """
@@ -43,7 +58,7 @@ def get_l10n(session, tid, lang):
     custom_texts = session.query(models.CustomTexts).filter(models.CustomTexts.lang == lang, models.CustomTexts.tid == tid).one_or_none()
     custom_texts = custom_texts.texts if custom_texts is not None else {}
 
-    texts = read_json_file(path)
+    texts = dict(read_langfile(path))
 
     texts.update(custom_texts)
 
@@ -64,73 +64,91 @@ def get_receivertips(session, tid, receiver_id, user_key, language, args={}):
                                  .group_by(models.ReceiverTip.internaltip_id):
         receiver_count_by_itip[itip_id] = count
 
-    # Retrieve all the contexts associated with the current receiver
-    receiver_contexts = set()
-    for context_id in session.query(models.ReceiverContext.context_id) \
-                             .filter(models.ReceiverContext.receiver_id == receiver_id):
-        receiver_contexts.add(context_id[0])
+    # Select the contexts associated with the current receiver within the tips query
+    receiver_contexts = session.query(models.ReceiverContext.context_id) \
+                               .filter(models.ReceiverContext.receiver_id == receiver_id) \
+                               .scalar_subquery()
 
     dict_ret = dict()
-    # Fetch rtip, internaltip and associated questionnaire schema
-    for rtip, itip, answers, data in session.query(models.ReceiverTip,
-                                                   models.InternalTip,
-                                                   models.InternalTipAnswers,
-                                                   models.InternalTipData) \
-                                            .join(models.InternalTipData,
-                                                  and_(models.InternalTipData.internaltip_id == models.InternalTip.id,
-                                                       models.InternalTipData.key == 'whistleblower_identity'),
-                                                  isouter=True) \
-                                            .filter(or_(models.InternalTip.context_id.in_(receiver_contexts),
-                                                    models.ReceiverTip.receiver_id == receiver_id),
-                                                    models.InternalTip.update_date >= updated_after,
-                                                    models.InternalTip.update_date <= updated_before,
-                                                    models.InternalTip.id == models.ReceiverTip.internaltip_id,
-                                                    models.InternalTipAnswers.internaltip_id == models.ReceiverTip.internaltip_id) \
-                                            .group_by(models.ReceiverTip.id):
-        answers = answers.answers
-        label = itip.label
-        accessible = rtip.receiver_id == receiver_id
-        if itip.crypto_tip_pub_key and accessible:
-            tip_key = GCE.asymmetric_decrypt(user_key, base64.b64decode(rtip.crypto_tip_prv_key))
+    # Fetch rtip, internaltip and answers selecting only the columns being
+    # serialized; plain rows avoid instantiating the models and decoding
+    # the whistleblower identity for every tip of the list
+    for row in session.query(models.ReceiverTip.receiver_id,
+                             models.ReceiverTip.crypto_tip_prv_key,
+                             models.ReceiverTip.access_date,
+                             models.ReceiverTip.last_access.label('rtip_last_access'),
+                             models.InternalTip.id,
+                             models.InternalTip.creation_date,
+                             models.InternalTip.last_access,
+                             models.InternalTip.update_date,
+                             models.InternalTip.expiration_date,
+                             models.InternalTip.reminder_date,
+                             models.InternalTip.progressive,
+                             models.InternalTip.important,
+                             models.InternalTip.label,
+                             models.InternalTip.context_id,
+                             models.InternalTip.tor,
+                             models.InternalTip.score,
+                             models.InternalTip.status,
+                             models.InternalTip.substatus,
+                             models.InternalTip.crypto_tip_pub_key,
+                             models.InternalTipAnswers.answers,
+                             models.InternalTipData.creation_date.label('data_creation_date')) \
+                      .join(models.InternalTipData,
+                            and_(models.InternalTipData.internaltip_id == models.InternalTip.id,
+                                 models.InternalTipData.key == 'whistleblower_identity'),
+                            isouter=True) \
+                      .filter(or_(models.InternalTip.context_id.in_(receiver_contexts),
+                              models.ReceiverTip.receiver_id == receiver_id),
+                              models.InternalTip.update_date >= updated_after,
+                              models.InternalTip.update_date <= updated_before,
+                              models.InternalTip.id == models.ReceiverTip.internaltip_id,
+                              models.InternalTipAnswers.internaltip_id == models.ReceiverTip.internaltip_id) \
+                      .group_by(models.ReceiverTip.id):
+        answers = row.answers
+        label = row.label
+        accessible = row.receiver_id == receiver_id
+        if row.crypto_tip_pub_key and accessible:
+            tip_key = GCE.asymmetric_decrypt(user_key, base64.b64decode(row.crypto_tip_prv_key))
 
             if label:
                 label = GCE.asymmetric_decrypt(tip_key, base64.b64decode(label.encode())).decode()
 
             answers = json.loads(GCE.asymmetric_decrypt(tip_key, base64.b64decode(answers.encode())).decode())
-        elif itip.crypto_tip_pub_key:
+        elif row.crypto_tip_pub_key:
             # remove useless and unusable crypted data
             answers = ""
             label = ""
 
-        if data is None:
+        if row.data_creation_date is None:
             subscription = 0
-        elif data.creation_date == itip.creation_date:
+        elif row.data_creation_date == row.creation_date:
             subscription = 1
         else:
             subscription = 2
 
-        if accessible or itip.id not in dict_ret:
-            dict_ret[itip.id] = {
-                'id': itip.id,
-                'creation_date': itip.creation_date,
-                'access_date': rtip.access_date,
-                'last_access': itip.last_access,
-                'update_date': itip.update_date,
-                'expiration_date': itip.expiration_date,
-                'reminder_date': itip.reminder_date,
-                'progressive': itip.progressive,
-                'important': itip.important,
+        if accessible or row.id not in dict_ret:
+            dict_ret[row.id] = {
+                'id': row.id,
+                'creation_date': row.creation_date,
+                'access_date': row.access_date,
+                'last_access': row.last_access,
+                'update_date': row.update_date,
+                'expiration_date': row.expiration_date,
+                'reminder_date': row.reminder_date,
+                'progressive': row.progressive,
+                'important': row.important,
                 'label': label,
-                'updated': rtip.last_access < itip.update_date,
-                'context_id': itip.context_id,
-                'tor': itip.tor,
+                'updated': row.rtip_last_access < row.update_date,
+                'context_id': row.context_id,
+                'tor': row.tor,
                 'answers': answers,
-                'score': itip.score,
-                'status': itip.status,
-                'substatus': itip.substatus,
-                'file_count': files_by_itip.get(itip.id, 0),
-                'comment_count': comments_by_itip.get(itip.id, 0),
-                'receiver_count': receiver_count_by_itip.get(itip.id, 0),
+                'score': row.score,
+                'status': row.status,
+                'substatus': row.substatus,
+                'file_count': files_by_itip.get(row.id, 0),
+                'comment_count': comments_by_itip.get(row.id, 0),
+                'receiver_count': receiver_count_by_itip.get(row.id, 0),
                 'subscription': subscription,
                 'accessible': accessible
             }
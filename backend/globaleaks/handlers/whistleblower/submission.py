@@ -5,9 +5,12 @@ import base64
 import json
 import re
 
+from sqlalchemy import cast, Integer
+
 from globaleaks import models
 from globaleaks.handlers.admin.questionnaire import db_get_questionnaire
 from globaleaks.handlers.base import BaseHandler
+from globaleaks.models import serializers
 from globaleaks.orm import db_get, db_log, transact
 from globaleaks.rest import errors, requests
 from globaleaks.state import State
@@ -123,13 +126,19 @@ def db_set_internaltip_data(session, itip_id, key, value, date=None):
 
 
 def db_assign_submission_progressive(session, tid):
-    counter = session.query(models.Config).filter(models.Config.tid == tid, models.Config.var_name == 'counter_submissions').one()
-    counter.value += 1
-    return counter.value
+    # Increment the counter in SQL instead of loading and storing the config entry
+    selector = (models.Config.tid == tid, models.Config.var_name == 'counter_submissions')
+
+    session.query(models.Config).filter(*selector) \
+           .update({'value': cast(models.Config.value, Integer) + 1}, synchronize_session=False)
+
+    return session.query(models.Config.value).filter(*selector).one()[0]
+
 
+def db_archive_questionnaire_schema(session, questionnaire, hash=None):
+    if hash is None:
+        hash = sha256(json.dumps(questionnaire, sort_keys=True)).decode("utf-8")
 
-def db_archive_questionnaire_schema(session, questionnaire):
-    hash = sha256(json.dumps(questionnaire, sort_keys=True)).decode("utf-8")
     if session.query(models.ArchivedSchema).filter(models.ArchivedSchema.hash == hash).count():
         return hash
 
@@ -141,6 +150,35 @@ def db_archive_questionnaire_schema(session, questionnaire):
     return hash
 
 
+def db_archive_questionnaire(session, tid, questionnaire_id, serialize_templates=False):
+    """
+    Transaction archiving the current schema of a questionnaire
+
+    The serialized schema and its hash are cached until an administrative
+    change to the questionnaires invalidates them.
+
+    :param session: An ORM session
+    :param tid: The tenant ID
+    :param questionnaire_id: The questionnaire to be archived
+    :param serialize_templates: Whether to serialize the fields templates
+    :return: The hash of the archived schema
+    """
+    key = (tid, questionnaire_id, serialize_templates)
+    generation = serializers.questionnaire_schemas.generation
+
+    entry = serializers.questionnaire_schemas.get(key)
+    if entry is None:
+        steps = db_get_questionnaire(session, tid, questionnaire_id, None, serialize_templates)['steps']
+        hash = sha256(json.dumps(steps, sort_keys=True)).decode("utf-8")
+
+        # not stored if an administrative change invalidated the cache meanwhile
+        entry = serializers.questionnaire_schemas.set(key, (hash, steps), generation)
+
+    hash, steps = entry
+
+    return db_archive_questionnaire_schema(session, steps, hash)
+
+
 def db_create_receivertip(session, receiver, internaltip, tip_key):
     """
     Create a receiver tip for the specified receiver
@@ -164,8 +202,7 @@ def db_create_submission(session, tid, request, user_session, client_using_tor,
                                      models.Questionnaire.id == models.Context.questionnaire_id))
 
     answers = request['answers']
-    steps = db_get_questionnaire(session, tid, questionnaire.id, None, True)['steps']
-    questionnaire_hash = db_archive_questionnaire_schema(session, steps)
+    questionnaire_hash = db_archive_questionnaire(session, tid, questionnaire.id, True)
 
     receivers = []
     for r in session.query(models.User).filter(models.User.id.in_(request['receivers'])):
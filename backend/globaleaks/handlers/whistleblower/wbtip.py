@@ -12,8 +12,7 @@ from globaleaks.handlers.admin.node import db_admin_serialize_node
 from globaleaks.handlers.admin.notification import db_get_notification
 from globaleaks.handlers.base import BaseHandler
 from globaleaks.handlers.whistleblower.submission import decrypt_tip, \
-    db_set_internaltip_answers, db_get_questionnaire, \
-    db_archive_questionnaire_schema, db_set_internaltip_data
+    db_set_internaltip_answers, db_archive_questionnaire, db_set_internaltip_data
 from globaleaks.handlers.user import user_serialize_user
 from globaleaks.models import serializers
 from globaleaks.orm import db_get, transact
@@ -133,8 +132,7 @@ def store_additional_questionnaire_answers(session, tid, user_id, answers, langu
     if not context.additional_questionnaire_id:
         return
 
-    steps = db_get_questionnaire(session, tid, context.additional_questionnaire_id, None)['steps']
-    questionnaire_hash = db_archive_questionnaire_schema(session, steps)
+    questionnaire_hash = db_archive_questionnaire(session, tid, context.additional_questionnaire_id)
 
     if itip.crypto_tip_pub_key:
         answers = base64.b64encode(GCE.asymmetric_encrypt(itip.crypto_tip_pub_key, json.dumps(answers).encode())).decode()
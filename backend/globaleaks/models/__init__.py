@@ -2,7 +2,7 @@
 """
 ORM Models definitions.
 """
-import copy
+import operator
 
 from globaleaks.models import config_desc
 from globaleaks.models.enums import *
@@ -10,10 +10,16 @@ from globaleaks.models.properties import *
 from globaleaks.utils.utility import datetime_now, datetime_never, datetime_null
 
 
+# datetimes are immutable, so a single instance can back every null date default
+_DATETIME_NULL = datetime_null()
+
+
 class LocalizationEngine(object):
     """
     This Class can manage all the localized strings inside one ORM object
     """
+    __slots__ = ('_localized_strings', '_localized_keys')
+
     def __init__(self, keys):
         self._localized_strings = {}
         self._localized_keys = keys
@@ -85,12 +91,97 @@ def get_localized_values(dictionary, obj, keys, language):
 Base = declarative_base()
 
 
+def _to_value(obj, key, value):
+    return value
+
+
+def _to_int(obj, key, value):
+    return int(value)
+
+
+_BOOL_MAP = {
+    'true': True,
+    'false': False,
+    True: True,
+    False: False
+}
+
+
+def _to_bool(obj, key, value):
+    try:
+        return _BOOL_MAP[value]
+    except (KeyError, TypeError):
+        return bool(value)
+
+
+def _to_localized(obj, key, value):
+    # Merge into a fresh dict instead of deep-copying the stored one: the
+    # translations are flat strings, and the column is never mutated in place.
+    # Localized columns are JSON dicts, so a non empty value needs no type check
+    previous = getattr(obj, key)
+
+    if previous:
+        value = {**previous, **value}
+
+    return value
+
+
+# inline expressions for the converters that need no access to the object
+_converter_templates = {
+    _to_value: 'v',
+    _to_int: 'int(v)'
+}
+
+
+def _compile_update_plan(plan):
+    """
+    Generate a function applying the given update plan with one straight
+    assignment per key instead of a generic loop over the plan.
+    """
+    namespace = {}
+    lines = ['def update_values(self, values):',
+             '    get = values.get']
+
+    for i, (key, convert) in enumerate(plan):
+        expr = _converter_templates.get(convert)
+        if expr is None:
+            namespace['convert_%d' % i] = convert
+            expr = 'convert_%d(self, %r, v)' % (i, key)
+
+        lines += ['    v = get(%r)' % key,
+                  '    if v is not None:',
+                  '        self.%s = %s' % (key, expr)]
+
+    exec('\n'.join(lines), namespace)
+
+    return namespace['update_values']
+
+
+def _serialized_default(column):
+    """
+    Return the value serialized by Model.dict() for an unset column;
+    dates are serialized empty even when they default to a constant
+    """
+    if column.default is not None and not callable(column.default.arg) and \
+            not isinstance(column.type, DateTime):
+        return column.default.arg
+
+    return ''
+
+
+# marks keys absent from the values passed to Model.update()
+_MISSING = object()
+
+
+_key_lists = ('unicode_keys', 'localized_keys', 'int_keys', 'bool_keys',
+              'datetime_keys', 'json_keys', 'date_keys', 'optional_references', 'list_keys')
+
+
 class Model(object):
     """
     Base ORM model
     """
     # initialize empty list for the base classes
-    properties = []
     unicode_keys = []
     localized_keys = []
     int_keys = []
@@ -101,99 +192,102 @@ class Model(object):
     optional_references = []
     list_keys = []
 
-    def __init__(self, values=None):
-        self.update(values)
-
-        self.properties = self.__mapper__.column_attrs.keys()
+    # Per class tables derived from the declarations above; they are the
+    # only thing update(), dict() and the migrations read at runtime
+    _column_names = ()
+    _update_values = None
+    _dict_getters = ()
 
-    def update(self, values=None):
+    def __init_subclass__(cls, **kwargs):
         """
-        Updated Models attributes from dict.
+        Compute the per class tables once, when the class is declared.
         """
-        if values is None:
-            return
+        super().__init_subclass__(**kwargs)
 
-        if 'id' in values and values['id']:
-            setattr(self, 'id', values['id'])
+        # ordered tuples for iteration and frozensets for membership tests
+        for name in _key_lists:
+            keys = getattr(cls, name)
+            setattr(cls, '_%s_seq' % name, tuple(keys))
+            setattr(cls, '_%s_set' % name, frozenset(keys))
 
-        if 'tid' in values and values['tid']:
-            setattr(self, 'tid', values['tid'])
+        # (key, converter) pairs applied by update()
+        update_plan = tuple((k, _to_value) for k in cls._unicode_keys_seq) + \
+                      tuple((k, _to_int) for k in cls._int_keys_seq) + \
+                      tuple((k, _to_value) for k in cls._datetime_keys_seq) + \
+                      tuple((k, _to_bool) for k in cls._bool_keys_seq) + \
+                      tuple((k, _to_localized) for k in cls._localized_keys_seq) + \
+                      tuple((k, _to_value) for k in cls._json_keys_seq)
 
-        for k in getattr(self, 'unicode_keys'):
-            if k in values and values[k] is not None:
-                setattr(self, k, values[k])
+        cls._update_values = _compile_update_plan(update_plan)
 
-        for k in getattr(self, 'int_keys'):
-            if k in values and values[k] is not None:
-                setattr(self, k, int(values[k]))
+        columns = {}
+        for c in reversed(cls.__mro__):
+            columns.update((k, v) for k, v in vars(c).items() if isinstance(v, Column))
 
-        for k in getattr(self, 'datetime_keys'):
-            if k in values and values[k] is not None:
-                setattr(self, k, values[k])
+        cls._column_names = tuple(columns)
 
-        for k in getattr(self, 'bool_keys'):
-            if k in values and values[k] is not None:
-                if values[k] == 'true':
-                    value = True
-                elif values[k] == 'false':
-                    value = False
-                else:
-                    value = bool(values[k])
-                setattr(self, k, value)
+        # (key, getter, value serialized when unset) triples used by dict()
+        cls._dict_getters = tuple((k, operator.attrgetter(k), _serialized_default(columns[k]))
+                                  for k in sorted(columns))
+
+    def __init__(self, values=None):
+        if values is not None:
+            self.update(values)
+
+    def update(self, values=None):
+        """
+        Updated Models attributes from dict.
+        """
+        if values is None:
+            return
 
-        for k in getattr(self, 'localized_keys'):
-            if k in values and values[k] is not None:
-                value = values[k]
-                previous = copy.deepcopy(getattr(self, k))
+        get = values.get
 
-                if previous and isinstance(previous, dict):
-                    previous.update(value)
-                    value = previous
+        value = get('id')
+        if value:
+            self.id = value
 
-                setattr(self, k, value)
+        value = get('tid')
+        if value:
+            self.tid = value
 
-        for k in getattr(self, 'json_keys'):
-            if k in values and values[k] is not None:
-                setattr(self, k, values[k])
+        cls = self.__class__
 
-        for k in getattr(self, 'optional_references'):
-            if k in values:
-                if values[k]:
-                    setattr(self, k, values[k])
-                else:
-                    setattr(self, k, None)
+        cls._update_values(self, values)
+
+        for k in cls._optional_references_seq:
+            value = get(k, _MISSING)
+            if value is not _MISSING:
+                setattr(self, k, value or None)
 
     def __setattr__(self, name, value):
-        if isinstance(value, bytes):
+        # crypto helpers return bytes that are assigned directly to text columns
+        if value.__class__ is bytes:
             value = value.decode()
 
-        return super(Model, self).__setattr__(name, value)
+        object.__setattr__(self, name, value)
 
     def dict(self, language=None):
         """
         Return a dictionary serialization of the current model.
         """
+        cls = self.__class__
         ret = {}
 
-        for k in self.properties:
-            value = getattr(self, k)
-
-            if value is not None:
-                if k in self.localized_keys:
-                    if language is not None:
-                        ret[k] = value[language] if language in value else ''
-                    else:
-                        ret[k] = value
+        for k, getter, default in cls._dict_getters:
+            value = getter(self)
 
-                elif k in self.date_keys:
-                    ret[k] = value
-            else:
-                if self.__table__.columns[k].default and not callable(self.__table__.columns[k].default.arg):
-                    ret[k] = self.__table__.columns[k].default.arg
+            if value is None:
+                ret[k] = default
+            elif k in cls._localized_keys_set:
+                if language is not None:
+                    ret[k] = value[language] if language in value else ''
                 else:
-                    ret[k] = ''
+                    ret[k] = value
+            elif k in cls._date_keys_set:
+                ret[k] = value
 
-        for k in self.list_keys:
+        for k in cls._list_keys_seq:
             ret[k] = []
 
         return ret
@@ -224,6 +318,10 @@ class _AuditLog(Model):
     object_id = Column(UnicodeText(36))
     data = Column(JSON)
 
+    unicode_keys = ['type', 'user_id', 'object_id']
+    int_keys = ['severity']
+    json_keys = ['data']
+
 
 class _Comment(Model):
     """
@@ -249,7 +347,7 @@ class _Config(Model):
     tid = Column(Integer, primary_key=True, default=1)
     var_name = Column(UnicodeText(64), primary_key=True)
     value = Column(JSON, default=dict, nullable=False)
-    update_date = Column(DateTime, default=datetime_null, nullable=False)
+    update_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
 
     @declared_attr
     def __table_args__(self):
@@ -291,7 +389,7 @@ class _ConfigL10N(Model):
     lang = Column(UnicodeText(12), primary_key=True)
     var_name = Column(UnicodeText(64), primary_key=True)
     value = Column(UnicodeText, nullable=False)
-    update_date = Column(DateTime, default=datetime_null, nullable=False)
+    update_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
 
     @declared_attr
     def __table_args__(self):
@@ -472,11 +570,10 @@ class _FieldAttr(Model):
         value = values['value']
 
         if self.type == 'localized':
-            previous = getattr(self, 'value')
+            # localized values map languages to strings; a shallow merge is enough
+            previous = self.value
             if previous and isinstance(previous, dict):
-                previous = copy.deepcopy(previous)
-                previous.update(value)
-                value = previous
+                value = {**previous, **value}
 
         self.value = value
 
@@ -510,7 +607,7 @@ class _FieldOptionTriggerField(Model):
     __tablename__ = 'fieldoptiontriggerfield'
 
     option_id = Column(UnicodeText(36), primary_key=True)
-    object_id = Column(UnicodeText(36), primary_key=True)
+    object_id = Column(UnicodeText(36), primary_key=True, index=True)
     sufficient = Column(Boolean, default=True, nullable=False)
 
     @declared_attr
@@ -523,7 +620,7 @@ class _FieldOptionTriggerStep(Model):
     __tablename__ = 'fieldoptiontriggerstep'
 
     option_id = Column(UnicodeText(36), primary_key=True)
-    object_id = Column(UnicodeText(36), primary_key=True)
+    object_id = Column(UnicodeText(36), primary_key=True, index=True)
     sufficient = Column(Boolean, default=True, nullable=False)
 
     @declared_attr
@@ -562,7 +659,7 @@ class _IdentityAccessRequest(Model):
     request_date = Column(DateTime, default=datetime_now, nullable=False)
     request_user_id = Column(UnicodeText(36), nullable=False)
     request_motivation = Column(UnicodeText, default='')
-    reply_date = Column(DateTime, default=datetime_null, nullable=False)
+    reply_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     reply_user_id = Column(UnicodeText(36))
     reply_motivation = Column(UnicodeText, default='', nullable=False)
     reply = Column(UnicodeText, default='pending', nullable=False)
@@ -581,7 +678,7 @@ class _IdentityAccessRequestCustodian(Model):
     __tablename__ = 'identityaccessrequest_custodian'
 
     identityaccessrequest_id = Column(UnicodeText(36), primary_key=True)
-    custodian_id = Column(UnicodeText(36), primary_key=True)
+    custodian_id = Column(UnicodeText(36), primary_key=True, index=True)
     crypto_tip_prv_key = Column(UnicodeText(84), default='', nullable=False)
 
     @declared_attr
@@ -620,7 +717,7 @@ class _InternalTip(Model):
     tid = Column(Integer, default=1, nullable=False)
     creation_date = Column(DateTime, default=datetime_now, nullable=False)
     update_date = Column(DateTime, default=datetime_now, nullable=False)
-    context_id = Column(UnicodeText(36), nullable=False)
+    context_id = Column(UnicodeText(36), nullable=False, index=True)
     operator_id = Column(UnicodeText(33), default='', nullable=False)
     progressive = Column(Integer, default=0, nullable=False)
     access_count = Column(Integer, default=0, nullable=False)
@@ -725,7 +822,7 @@ class _ReceiverContext(Model):
     __tablename__ = 'receiver_context'
 
     context_id = Column(UnicodeText(36), primary_key=True)
-    receiver_id = Column(UnicodeText(36), primary_key=True)
+    receiver_id = Column(UnicodeText(36), primary_key=True, index=True)
     order = Column(Integer, default=0, nullable=False)
 
     unicode_keys = ['context_id', 'receiver_id']
@@ -746,7 +843,7 @@ class _WhistleblowerFile(Model):
     id = Column(UnicodeText(36), primary_key=True, default=uuid4)
     internalfile_id = Column(UnicodeText(36), nullable=False, index=True)
     receivertip_id = Column(UnicodeText(36), nullable=False, index=True)
-    access_date = Column(DateTime, default=datetime_null, nullable=False)
+    access_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     new = Column(Boolean, default=True, nullable=False)
 
     @declared_attr
@@ -766,9 +863,9 @@ class _ReceiverTip(Model):
     id = Column(UnicodeText(36), primary_key=True, default=uuid4)
     internaltip_id = Column(UnicodeText(36), nullable=False, index=True)
     receiver_id = Column(UnicodeText(36), nullable=False, index=True)
-    access_date = Column(DateTime, default=datetime_null, nullable=False)
-    last_access = Column(DateTime, default=datetime_null, nullable=False)
-    last_notification = Column(DateTime, default=datetime_null, nullable=False)
+    access_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
+    last_access = Column(DateTime, default=_DATETIME_NULL, nullable=False)
+    last_notification = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     new = Column(Boolean, default=True, nullable=False)
     enable_notifications = Column(Boolean, default=True, nullable=False)
     crypto_tip_prv_key = Column(UnicodeText(84), default='', nullable=False)
@@ -867,7 +964,7 @@ class _SubmissionSubStatus(Model):
 
     id = Column(UnicodeText(36), primary_key=True, default=uuid4)
     tid = Column(Integer, primary_key=True, default=1)
-    submissionstatus_id = Column(UnicodeText(36), nullable=False)
+    submissionstatus_id = Column(UnicodeText(36), nullable=False, index=True)
     label = Column(JSON, default=dict, nullable=False)
     order = Column(Integer, default=0, nullable=False)
     tip_timetolive = Column(Integer, default=0, nullable=False)
@@ -950,11 +1047,11 @@ class _User(Model):
     public_name = Column(UnicodeText, default='', nullable=False)
     role = Column(Enum(EnumUserRole), default='receiver', nullable=False)
     enabled = Column(Boolean, default=True, nullable=False)
-    last_login = Column(DateTime, default=datetime_null, nullable=False)
+    last_login = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     mail_address = Column(UnicodeText, default='', nullable=False)
     language = Column(UnicodeText(12), nullable=False)
     password_change_needed = Column(Boolean, default=True, nullable=False)
-    password_change_date = Column(DateTime, default=datetime_null, nullable=False)
+    password_change_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     crypto_prv_key = Column(UnicodeText(84), default='', nullable=False)
     crypto_pub_key = Column(UnicodeText(56), default='', nullable=False)
     crypto_rec_key = Column(UnicodeText(80), default='', nullable=False)
@@ -964,7 +1061,7 @@ class _User(Model):
     crypto_escrow_bkp2_key = Column(UnicodeText(84), default='', nullable=False)
     change_email_address = Column(UnicodeText, default='', nullable=False)
     change_email_token = Column(UnicodeText, unique=True)
-    change_email_date = Column(DateTime, default=datetime_null, nullable=False)
+    change_email_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     notification = Column(Boolean, default=True, nullable=False)
     forcefully_selected = Column(Boolean, default=False, nullable=False)
     can_delete_submission = Column(Boolean, default=False, nullable=False)
@@ -977,15 +1074,15 @@ class _User(Model):
     can_edit_general_settings = Column(Boolean, default=False, nullable=False)
     readonly = Column(Boolean, default=False, nullable=False)
     two_factor_secret = Column(UnicodeText(32), default='', nullable=False)
-    reminder_date = Column(DateTime, default=datetime_null, nullable=False)
+    reminder_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
 
     # BEGIN of PGP key fields
     pgp_key_fingerprint = Column(UnicodeText, default='', nullable=False)
     pgp_key_public = Column(UnicodeText, default='', nullable=False)
-    pgp_key_expiration = Column(DateTime, default=datetime_null, nullable=False)
+    pgp_key_expiration = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     # END of PGP key fields
 
-    accepted_privacy_policy = Column(DateTime, default=datetime_null, nullable=False)
+    accepted_privacy_policy = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     clicked_recovery_key = Column(Boolean, default=False, nullable=False)
 
     unicode_keys = ['username', 'role',
@@ -1041,7 +1138,7 @@ class _ReceiverFile(Model):
     size = Column(Integer, nullable=False)
     content_type = Column(UnicodeText, nullable=False)
     creation_date = Column(DateTime, default=datetime_now, nullable=False)
-    access_date = Column(DateTime, default=datetime_null, nullable=False)
+    access_date = Column(DateTime, default=_DATETIME_NULL, nullable=False)
     description = Column(UnicodeText, default="", nullable=False)
     visibility = Column(Enum(EnumVisibility), default='public', nullable=False)
     new = Column(Boolean, default=True, nullable=False)
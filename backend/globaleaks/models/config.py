@@ -2,7 +2,7 @@
 from sqlalchemy import not_
 from globaleaks.models import Config, ConfigL10N, EnabledLanguage
 from globaleaks.models.properties import *
-from globaleaks.models.config_desc import ConfigDescriptor, ConfigFilters, ConfigL10NFilters
+from globaleaks.models.config_desc import ConfigDescriptor, ConfigFilters, ConfigL10NFilters, ConfigL10NFilterSets
 from globaleaks.utils.onion import generate_onion_service_v3
 
 
@@ -95,7 +95,8 @@ class ConfigL10NFactory(object):
 
     def serialize(self, filter_name, lang):
         rows = self.get_all(filter_name, lang)
-        return {c.var_name: c.value for c in rows if c.var_name in ConfigL10NFilters[filter_name]}
+        keys = ConfigL10NFilterSets[filter_name]
+        return {c.var_name: c.value for c in rows if c.var_name in keys}
 
     def update(self, filter_name, data, lang):
         c_map = {c.var_name: c for c in self.get_all(filter_name, lang)}
@@ -108,14 +109,14 @@ class ConfigL10NFactory(object):
         templates = data.get('templates', {})
 
         for lang in langs:
-            old_keys = []
+            old_keys = set()
 
             for cfg in self.get_all(filter_name, lang):
-                old_keys.append(cfg.var_name)
+                old_keys.add(cfg.var_name)
                 if (cfg.update_date == null or reset) and cfg.var_name in templates:
                     cfg.value = templates[cfg.var_name][lang]
 
-            ConfigL10NFactory.initialize(self, list(set(ConfigL10NFilters[filter_name]) - set(old_keys)), lang, data)
+            ConfigL10NFactory.initialize(self, list(ConfigL10NFilterSets[filter_name] - old_keys), lang, data)
 
     def get_val(self, var_name, lang):
         v = self.session.query(ConfigL10N.value).filter(ConfigL10N.tid == self.tid, ConfigL10N.lang == lang, ConfigL10N.var_name == var_name).one_or_none()
@@ -180,7 +181,7 @@ def update_defaults(session, tid, appdata):
 
     langs = [x[0] for x in session.query(EnabledLanguage.name).filter(EnabledLanguage.tid == tid)]
 
-    session.query(ConfigL10N).filter(ConfigL10N.tid == tid, not_(ConfigL10N.var_name.in_(list(set(ConfigL10NFilters['node']).union(ConfigL10NFilters['notification']))))).delete(synchronize_session=False)
+    session.query(ConfigL10N).filter(ConfigL10N.tid == tid, not_(ConfigL10N.var_name.in_(list(ConfigL10NFilterSets['node'] | ConfigL10NFilterSets['notification'])))).delete(synchronize_session=False)
 
     ConfigL10NFactory(session, tid).update_defaults('node', langs, appdata['node'])
     ConfigL10NFactory(session, tid).update_defaults('notification', langs, appdata['templates'])
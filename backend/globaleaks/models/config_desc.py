@@ -398,3 +398,7 @@ ConfigL10NFilters = {
 ConfigL10NFilters['admin_node'] = ConfigL10NFilters['node']
 ConfigL10NFilters['public_node'] = ConfigL10NFilters['node']
 ConfigL10NFilters['general_settings'] = ConfigL10NFilters['node']
+
+# Frozen copies of the filters used for membership tests on config rows
+ConfigFilterSets = {k: frozenset(v) for k, v in ConfigFilters.items()}
+ConfigL10NFilterSets = {k: frozenset(v) for k, v in ConfigL10NFilters.items()}
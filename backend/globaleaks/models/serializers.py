@@ -5,9 +5,54 @@ import os
 from globaleaks import models
 from globaleaks.models.config import ConfigFactory
 from globaleaks.state import State
+from globaleaks.utils.boundedcache import BoundedCache
 from sqlalchemy import or_, and_
 
 
+# Archived schemas are addressed by the hash of their content and never
+# change, so their decoded and localized forms can be kept across requests
+ARCHIVED_SCHEMA_CACHE_SIZE = 512
+_archived_schemas = BoundedCache(ARCHIVED_SCHEMA_CACHE_SIZE)
+_localized_archived_schemas = BoundedCache(ARCHIVED_SCHEMA_CACHE_SIZE)
+
+# The current schema of the questionnaires and its hash, reused across
+# submissions; cleared after every write of the handlers flagged with
+# invalidate_cache (see rest/decorators.py)
+questionnaire_schemas = BoundedCache(ARCHIVED_SCHEMA_CACHE_SIZE)
+
+
+def invalidate_questionnaire_schemas(result=None):
+    """
+    Drop the cached schemas of the current questionnaires
+
+    :param result: The result of the deferred this is chained to
+    :return: The result unchanged
+    """
+    questionnaire_schemas.clear()
+
+    return result
+
+
+def db_get_archived_schema(session, hash):
+    """
+    Return the decoded archived questionnaire schema with the given hash
+
+    :param session: An ORM session
+    :param hash: The hash of the archived schema
+    :return: The decoded schema, or None if no schema has that hash
+    """
+    schema = _archived_schemas.get(hash)
+    if schema is not None:
+        return schema
+
+    schema = session.query(models.ArchivedSchema.schema) \
+                    .filter(models.ArchivedSchema.hash == hash).scalar()
+    if schema is None:
+        return None
+
+    return _archived_schemas.set(hash, schema)
+
+
 def serialize_archived_field_recursively(field, language):
     for key, _ in field.get('attrs', {}).items():
         if key not in field['attrs']:
@@ -43,14 +88,33 @@ def serialize_archived_questionnaire_schema(questionnaire_schema, language):
     return questionnaire
 
 
-def serialize_identityaccessrequest(session, identityaccessrequest):
-    itip, request_user = session.query(models.InternalTip, models.User) \
-                                .filter(models.InternalTip.id == identityaccessrequest.internaltip_id,
-                                        models.User.id == identityaccessrequest.request_user_id).one()
+def db_serialize_archived_schema(session, hash, language):
+    """
+    Return the archived questionnaire schema with the given hash localized
+    in the requested language.
 
-    reply_user = session.query(models.User) \
-                        .filter(models.User.id == identityaccessrequest.reply_user_id).one_or_none()
+    The result is shared by every tip using the same schema and language:
+    callers only read it and must never modify it in place.
+
+    :param session: An ORM session
+    :param hash: The hash of the archived schema
+    :param language: The language of the serialization
+    :return: The serialized schema, or None if no schema has that hash
+    """
+    key = (hash, language)
 
+    steps = _localized_archived_schemas.get(key)
+    if steps is not None:
+        return steps
+
+    schema = db_get_archived_schema(session, hash)
+    if schema is None:
+        return None
+
+    return _localized_archived_schemas.set(key, serialize_archived_questionnaire_schema(schema, language))
+
+
+def _serialize_identityaccessrequest(identityaccessrequest, itip, request_user, reply_user):
     return {
         'id': identityaccessrequest.id,
         'internaltip_id': identityaccessrequest.internaltip_id,
@@ -65,6 +129,44 @@ def serialize_identityaccessrequest(session, identityaccessrequest):
         'submission_date': itip.creation_date
     }
 
+
+def serialize_identityaccessrequest(session, identityaccessrequest):
+    itip, request_user = session.query(models.InternalTip, models.User) \
+                                .filter(models.InternalTip.id == identityaccessrequest.internaltip_id,
+                                        models.User.id == identityaccessrequest.request_user_id).one()
+
+    reply_user = session.query(models.User) \
+                        .filter(models.User.id == identityaccessrequest.reply_user_id).one_or_none()
+
+    return _serialize_identityaccessrequest(identityaccessrequest, itip, request_user, reply_user)
+
+
+def serialize_identityaccessrequests(session, identityaccessrequests):
+    """
+    Serialize a list of identity access requests loading the tips and the
+    users they reference with one query each instead of per request
+
+    :param session: An ORM session
+    :param identityaccessrequests: The list of requests to be serialized
+    :return: The list of the serialized requests, in the same order
+    """
+    if not identityaccessrequests:
+        return []
+
+    itips_ids = {iar.internaltip_id for iar in identityaccessrequests}
+    users_ids = {iar.request_user_id for iar in identityaccessrequests} | \
+                {iar.reply_user_id for iar in identityaccessrequests if iar.reply_user_id}
+
+    itips = {itip.id: itip for itip in session.query(models.InternalTip).filter(models.InternalTip.id.in_(itips_ids))}
+    users = {user.id: user for user in session.query(models.User).filter(models.User.id.in_(users_ids))}
+
+    return [_serialize_identityaccessrequest(iar,
+                                             itips[iar.internaltip_id],
+                                             users[iar.request_user_id],
+                                             users.get(iar.reply_user_id))
+            for iar in identityaccessrequests]
+
+
 def serialize_comment(session, comment):
     """
     Transaction returning a serialized descriptor of a comment
@@ -168,15 +270,18 @@ def serialize_rfile(session, rfile):
     }
 
 def serialize_itip(session, internaltip, language):
-    x = session.query(models.InternalTipAnswers, models.ArchivedSchema) \
-               .filter(models.ArchivedSchema.hash == models.InternalTipAnswers.questionnaire_hash,
-                       models.InternalTipAnswers.internaltip_id == internaltip.id) \
+    x = session.query(models.InternalTipAnswers) \
+               .filter(models.InternalTipAnswers.internaltip_id == internaltip.id) \
                .order_by(models.InternalTipAnswers.creation_date.asc())
 
     questionnaires = []
-    for ita, aqs in x:
+    for ita in x:
+        steps = db_serialize_archived_schema(session, ita.questionnaire_hash, language)
+        if steps is None:
+            continue
+
         questionnaires.append({
-            'steps': serialize_archived_questionnaire_schema(aqs.schema, language),
+            'steps': steps,
             'answers': ita.answers
         })
 
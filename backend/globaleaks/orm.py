@@ -109,6 +109,18 @@ def db_add(session, model_class, model_fields):
     return obj
 
 
+def db_add_all(session, model_class, rows):
+    """
+    Create an object of model_class for each of the rows and insert them with a single flush
+    """
+    objs = [model_class(values) for values in rows]
+    if objs:
+        session.add_all(objs)
+        session.flush()
+
+    return objs
+
+
 def db_query(session, selector, filter=None):
     if isinstance(selector, tuple):
         q = session.query(*selector)
@@ -133,12 +145,7 @@ def db_del(session, selector, filter=None):
 
 
 def db_log(session, **kwargs):
-    entry = AuditLog()
-
-    for key, value in kwargs.items():
-         setattr(entry, key, value)
-
-    session.add(entry)
+    session.add(AuditLog(kwargs))
 
 
 class transact(object):
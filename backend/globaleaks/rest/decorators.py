@@ -6,6 +6,7 @@ from twisted.internet import defer
 from twisted.internet.threads import deferToThread
 
 from globaleaks.db import sync_refresh_tenant_cache
+from globaleaks.models.serializers import invalidate_questionnaire_schemas
 from globaleaks.rest import errors
 from globaleaks.rest.cache import Cache
 from globaleaks.state import State
@@ -13,12 +14,15 @@ from globaleaks.utils.json import JSONEncoder
 from globaleaks.utils.utility import datetime_now, deferred_sleep
 
 
+RATE_LIMIT_WINDOW = timedelta(seconds=1)
+
+
 def decorator_rate_limit(f):
     # Decorator that enforces rate limiting on authenticated whistleblowers' sessions
     def wrapper(self, *args, **kwargs):
         if self.session and self.session.user_role == 'whistleblower':
             now = datetime_now()
-            if now > self.session.ratelimit_time + timedelta(seconds=1):
+            if now > self.session.ratelimit_time + RATE_LIMIT_WINDOW:
                 self.session.ratelimit_time = now
                 self.session.ratelimit_count = 0
 
@@ -114,6 +118,19 @@ def decorator_cache_invalidate(f):
     return wrapper
 
 
+def decorator_questionnaire_schemas_invalidate(f):
+    # Decorator that drops the cached questionnaire schemas once an administrative change is committed
+    def wrapper(self, *args, **kwargs):
+        ret = f(self, *args, **kwargs)
+
+        if isinstance(ret, defer.Deferred):
+            return ret.addCallback(invalidate_questionnaire_schemas)
+
+        return invalidate_questionnaire_schemas(ret)
+
+    return wrapper
+
+
 def decorate_method(h, method):
     roles = getattr(h, 'check_roles')
     if isinstance(roles, str):
@@ -130,6 +147,9 @@ def decorate_method(h, method):
                 f = decorator_cache_invalidate(f)
 
     if method in ['delete', 'post', 'put']:
+        if h.invalidate_cache:
+            f = decorator_questionnaire_schemas_invalidate(f)
+
         f = decorator_require_session_or_token(f)
         f = decorator_rate_limit(f)
 
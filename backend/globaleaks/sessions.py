@@ -6,6 +6,9 @@ from globaleaks.utils.utility import datetime_now, uuid4
 
 
 class Session(object):
+    __slots__ = ('id', 'tid', 'user_id', 'user_tid', 'user_role', 'properties', 'permissions',
+                 'cc', 'ek', 'user_name', 'ratelimit_time', 'ratelimit_count', 'files', 'expireCall')
+
     def __init__(self, tid, user_id, user_tid, user_name, user_role, cc='', ek=''):
         self.id = generateRandomKey()
         self.tid = tid
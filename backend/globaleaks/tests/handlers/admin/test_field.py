@@ -4,10 +4,12 @@ import copy
 from globaleaks import models
 from globaleaks.handlers import admin
 from globaleaks.handlers.admin.context import create_context
-from globaleaks.handlers.admin.field import create_field
+from globaleaks.handlers.admin.field import create_field, db_create_field, \
+    db_update_fieldattrs, db_update_fieldoptions
 from globaleaks.orm import transact
 from globaleaks.rest import errors
 from globaleaks.tests import helpers
+from globaleaks.utils.utility import uuid4
 from twisted.internet.defer import inlineCallbacks
 
 
@@ -194,3 +196,39 @@ class TestFieldTemplatesCollection(helpers.TestHandlerWithPopulatedDB):
         response = yield handler.post()
         self.assertIn('id', response)
         self.assertNotEqual(response.get('options'), None)
+
+
+class TestFieldOptionsAndAttrs(helpers.TestGL):
+    def test_update_existing_and_insert_new(self):
+        @transact
+        def transaction(session):
+            values = helpers.get_dummy_field()
+            values['attrs'] = {
+                'a': {'type': 'int', 'value': 1},
+                'b': {'type': 'localized', 'value': 'b'}
+            }
+            field = db_create_field(session, 1, values, 'en')
+            kept, removed = values['options']
+
+            # update the first option, drop the second one and add a new one
+            new_option = dict(kept, id=uuid4(), label='new')
+            db_update_fieldoptions(session, field.id, [dict(kept, label='updated'), new_option], 'en')
+
+            options = session.query(models.FieldOption) \
+                             .filter(models.FieldOption.field_id == field.id) \
+                             .order_by(models.FieldOption.order)
+
+            self.assertEqual([(o.id, o.label['en'], o.order) for o in options],
+                             [(kept['id'], 'updated', 0), (new_option['id'], 'new', 1)])
+
+            # update an attribute, drop one and add a new one
+            db_update_fieldattrs(session, field.id, {
+                'a': {'type': 'int', 'value': 2},
+                'c': {'type': 'bool', 'value': True}
+            }, 'en')
+
+            attrs = session.query(models.FieldAttr).filter(models.FieldAttr.field_id == field.id)
+
+            self.assertEqual({a.name: a.value for a in attrs}, {'a': 2, 'c': True})
+
+        return transaction()
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 from twisted.internet.defer import inlineCallbacks
 
+from globaleaks import models
 from globaleaks.handlers import admin
 from globaleaks.handlers.admin.step import db_create_step
-from globaleaks.orm import tw
+from globaleaks.handlers.whistleblower import submission
+from globaleaks.models import serializers
+from globaleaks.orm import transact, tw
 from globaleaks.tests import helpers
 
 
@@ -53,3 +56,51 @@ class TestStepInstance(helpers.TestHandler):
 
         handler = self.request(role='admin')
         yield handler.delete(step['id'])
+
+
+class TestStepInstanceSubmission(helpers.TestHandlerWithPopulatedDB):
+    _handler = admin.step.StepInstance
+
+    @transact
+    def get_archived_steps_labels(self, session):
+        return [[step['label']['en'] for step in schema]
+                for schema, in session.query(models.ArchivedSchema.schema)
+                                      .filter(models.ArchivedSchema.hash == models.InternalTipAnswers.questionnaire_hash)
+                                      .order_by(models.InternalTipAnswers.creation_date)]
+
+    @inlineCallbacks
+    def test_put_invalidates_questionnaire_schemas(self):
+        yield self.perform_minimal_submission_actions()
+        self.assertEqual(len(serializers.questionnaire_schemas), 1)
+
+        step = self.dummyQuestionnaire['steps'][1]
+        step['label'] = 'Edited step'
+
+        handler = self.request(step, role='admin')
+        yield handler.put(step['id'])
+        self.assertEqual(len(serializers.questionnaire_schemas), 0)
+
+        yield self.perform_minimal_submission_actions()
+
+        labels = yield self.get_archived_steps_labels()
+        self.assertEqual(len(labels), 2)
+        self.assertNotIn('Edited step', labels[0])
+        self.assertIn('Edited step', labels[1])
+
+    @inlineCallbacks
+    def test_invalidation_during_serialization(self):
+        db_get_questionnaire = submission.db_get_questionnaire
+
+        def concurrent_edit(*args, **kwargs):
+            ret = db_get_questionnaire(*args, **kwargs)
+            serializers.invalidate_questionnaire_schemas()
+            return ret
+
+        self.patch(submission, 'db_get_questionnaire', concurrent_edit)
+
+        @transact
+        def transaction(session):
+            submission.db_archive_questionnaire(session, 1, self.dummyContext['questionnaire_id'])
+
+        yield transaction()
+        self.assertEqual(len(serializers.questionnaire_schemas), 0)
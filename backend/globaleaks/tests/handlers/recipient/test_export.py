@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+import copy
 
+from globaleaks import models
 from globaleaks.handlers.recipient import export
 from globaleaks.jobs.delivery import Delivery
+from globaleaks.models import serializers
+from globaleaks.orm import transact
 from globaleaks.tests import helpers
 from twisted.internet.defer import inlineCallbacks
 
@@ -32,3 +36,22 @@ class TestExportHandler(helpers.TestHandlerWithPopulatedDB):
 
         yield handler.get(rtips_desc[0]['id'])
         self.assertNotEqual(handler.request.getResponseBody(), b'')
+
+    @inlineCallbacks
+    def test_export_does_not_modify_cached_schemas(self):
+        @transact
+        def get_cached_schemas(session):
+            return [serializers.db_serialize_archived_schema(session, x[0], 'en')
+                    for x in session.query(models.InternalTipAnswers.questionnaire_hash)]
+
+        rtips_desc = yield self.get_rtips()
+        schemas = yield get_cached_schemas()
+        expected = copy.deepcopy(schemas)
+
+        handler = self.request({}, role='receiver')
+        handler.session.user_id = rtips_desc[0]['receiver_id']
+
+        yield handler.get(rtips_desc[0]['id'])
+        yield self.get_wbtips()
+
+        self.assertEqual(schemas, expected)
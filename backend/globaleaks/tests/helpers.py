@@ -580,6 +580,8 @@ class TestGL(unittest.TestCase):
 
         init_state()
 
+        serializers.invalidate_questionnaire_schemas()
+
         self.setUp_dummy()
 
         if self.initialize_test_database_using_archived_db:
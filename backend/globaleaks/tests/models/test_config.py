@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
+from sqlalchemy import text
+from twisted.internet.defer import inlineCallbacks
+
 from globaleaks import models
+from globaleaks.handlers.whistleblower.submission import db_assign_submission_progressive
 from globaleaks.models import config
-from globaleaks.orm import transact
+from globaleaks.orm import transact, tw
 from globaleaks.tests import helpers
 
 
@@ -30,3 +34,28 @@ class TestModels(helpers.TestGL):
             config.ConfigFactory(session, 1).update_defaults()
 
         return transaction()
+
+    @inlineCallbacks
+    def test_submission_counter(self):
+        @transact
+        def increment(session):
+            return [db_assign_submission_progressive(session, 1) for _ in range(3)]
+
+        @transact
+        def check(session, value):
+            # the counter is stored as JSON text and decoded as an integer
+            raw = session.execute(text("SELECT value FROM config WHERE tid = 1 AND var_name = 'counter_submissions'")).scalar()
+            self.assertEqual(raw, str(value))
+            self.assertEqual(config.db_get_config_variable(session, 1, 'counter_submissions'), value)
+
+        yield check(0)
+
+        progressives = yield increment()
+        self.assertEqual(progressives, [1, 2, 3])
+        yield check(3)
+
+        # the stored value is still accepted by the typed config setter
+        yield tw(config.db_set_config_variable, 1, 'counter_submissions', 10)
+        progressives = yield increment()
+        self.assertEqual(progressives, [11, 12, 13])
+        yield check(13)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from twisted.trial import unittest
+
+from globaleaks import models
+
+
+class TestModelUpdate(unittest.TestCase):
+    def test_update(self):
+        user = models.User({
+            'username': 'receiver',
+            'enabled': 'false',
+            'notification': 1,
+            'description': {'en': 'description'},
+            'readonly': None
+        })
+
+        self.assertEqual(user.username, 'receiver')
+        self.assertFalse(user.enabled)
+        self.assertTrue(user.notification)
+        self.assertEqual(user.description, {'en': 'description'})
+        self.assertIsNone(user.readonly)
+
+    def test_update_merges_localized_keys(self):
+        step = models.Step({'label': {'en': 'label'}, 'order': '3'})
+        step.update({'label': {'it': 'etichetta'}})
+
+        self.assertEqual(step.label, {'en': 'label', 'it': 'etichetta'})
+        self.assertEqual(step.order, 3)
+
+    def test_update_optional_references(self):
+        field = models.Field({'step_id': 'step', 'fieldgroup_id': ''})
+
+        self.assertEqual(field.step_id, 'step')
+        self.assertIsNone(field.fieldgroup_id)
+
+    def test_update_does_not_mutate_stored_localized_dict(self):
+        step = models.Step({'label': {'en': 'label'}})
+        label = step.label
+
+        step.update({'label': {'it': 'etichetta'}})
+
+        self.assertEqual(label, {'en': 'label'})
+        self.assertIsNot(step.label, label)
+
+    def test_dict_of_unset_dates(self):
+        user = models.User().dict()
+
+        for k in ['last_login', 'password_change_date', 'pgp_key_expiration', 'accepted_privacy_policy']:
+            self.assertEqual(user[k], '')
+
+    def test_dict_of_new_user(self):
+        # the serialization used by the wizard to create the first users
+        self.assertEqual(models.User().dict(), {
+            'accepted_privacy_policy': '',
+            'can_delete_submission': False,
+            'can_edit_general_settings': False,
+            'can_grant_access_to_reports': False,
+            'can_mask_information': True,
+            'can_postpone_expiration': True,
+            'can_redact_information': False,
+            'can_reopen_reports': True,
+            'can_transfer_access_to_reports': False,
+            'change_email_address': '',
+            'change_email_date': '',
+            'change_email_token': '',
+            'clicked_recovery_key': False,
+            'creation_date': '',
+            'crypto_bkp_key': '',
+            'crypto_escrow_bkp1_key': '',
+            'crypto_escrow_bkp2_key': '',
+            'crypto_escrow_prv_key': '',
+            'crypto_prv_key': '',
+            'crypto_pub_key': '',
+            'crypto_rec_key': '',
+            'description': '',
+            'enabled': True,
+            'forcefully_selected': False,
+            'hash': '',
+            'id': '',
+            'language': '',
+            'last_login': '',
+            'mail_address': '',
+            'name': '',
+            'notification': True,
+            'password_change_date': '',
+            'password_change_needed': True,
+            'pgp_key_expiration': '',
+            'pgp_key_fingerprint': '',
+            'pgp_key_public': '',
+            'public_name': '',
+            'readonly': False,
+            'reminder_date': '',
+            'role': 'receiver',
+            'salt': '',
+            'tid': 1,
+            'two_factor_secret': '',
+            'username': ''
+        })
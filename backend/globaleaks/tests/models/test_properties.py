@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from globaleaks import models
+from globaleaks.orm import transact
+from globaleaks.tests import helpers
+
+
+class TestJSON(helpers.TestGL):
+    def test_roundtrip_through_the_database(self):
+        value = {'label': {'en': 'Whistleblower', 'it': 'Segnalante è', 'ru': 'Информатор', 'zh_CN': '举报人'}}
+
+        @transact
+        def transaction(session):
+            aqs = models.ArchivedSchema()
+            aqs.hash = 'hash'
+            aqs.schema = value
+            session.add(aqs)
+            session.flush()
+            session.expire(aqs)
+
+            self.assertEqual(aqs.schema, value)
+
+        return transaction()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from globaleaks import models
+from globaleaks.models import serializers
+from globaleaks.orm import transact
+from globaleaks.tests import helpers
+from globaleaks.utils.boundedcache import BoundedCache
+
+
+class TestArchivedSchemaCache(helpers.TestGL):
+    def setUp(self):
+        self.patch(serializers, '_archived_schemas', BoundedCache(2))
+        return helpers.TestGL.setUp(self)
+
+    def test_db_get_archived_schema(self):
+        @transact
+        def transaction(session):
+            for i in range(3):
+                aqs = models.ArchivedSchema()
+                aqs.hash = 'hash%d' % i
+                aqs.schema = [{'id': i}]
+                session.add(aqs)
+
+            session.flush()
+
+            # miss
+            self.assertIsNone(serializers.db_get_archived_schema(session, 'unknown'))
+            self.assertNotIn('unknown', serializers._archived_schemas)
+
+            # load and hit
+            schema = serializers.db_get_archived_schema(session, 'hash0')
+            self.assertEqual(schema, [{'id': 0}])
+            self.assertIs(serializers.db_get_archived_schema(session, 'hash0'), schema)
+
+            # eviction of the oldest entry
+            serializers.db_get_archived_schema(session, 'hash1')
+            serializers.db_get_archived_schema(session, 'hash2')
+            self.assertEqual(len(serializers._archived_schemas), 2)
+            self.assertNotIn('hash0', serializers._archived_schemas)
+
+            # an evicted schema is loaded again from the database
+            self.assertEqual(serializers.db_get_archived_schema(session, 'hash0'), [{'id': 0}])
+
+        return transaction()
+
+    def test_db_serialize_archived_schema(self):
+        self.patch(serializers, '_localized_archived_schemas', BoundedCache(2))
+
+        @transact
+        def transaction(session):
+            aqs = models.ArchivedSchema()
+            aqs.hash = 'hash'
+            aqs.schema = [{'label': {'en': 'Step', 'it': 'Passo'}, 'description': {}, 'children': []}]
+            session.add(aqs)
+            session.flush()
+
+            self.assertIsNone(serializers.db_serialize_archived_schema(session, 'unknown', 'en'))
+
+            en = serializers.db_serialize_archived_schema(session, 'hash', 'en')
+            it = serializers.db_serialize_archived_schema(session, 'hash', 'it')
+            self.assertEqual(en[0]['label'], 'Step')
+            self.assertEqual(it[0]['label'], 'Passo')
+
+            # the localized schema is shared across reads...
+            self.assertIs(serializers.db_serialize_archived_schema(session, 'hash', 'en'), en)
+
+            # ...while the decoded schema is left untouched by the localization
+            self.assertEqual(serializers.db_get_archived_schema(session, 'hash')[0]['label'],
+                             {'en': 'Step', 'it': 'Passo'})
+
+        return transaction()
@@ -7,11 +7,13 @@ for each version one an empty and a populated db must be sessiond in directories
 """
 import os
 import shutil
+import sqlite3
 
 from twisted.trial import unittest
 
 from globaleaks import DATABASE_VERSION, FIRST_DATABASE_VERSION_SUPPORTED
 from globaleaks.db import update_db
+from globaleaks.models import Base
 from globaleaks.settings import Settings
 from globaleaks.tests import helpers
 
@@ -47,3 +49,27 @@ path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'db', 'populate
 
 for i in range(FIRST_DATABASE_VERSION_SUPPORTED, DATABASE_VERSION + 1):
     setattr(TestMigrationRoutines, "test_db_migration_%d" % i, test(path, i))
+
+
+class TestMissingIndexes(unittest.TestCase):
+    def _test(self, version):
+        helpers.init_state()
+        srcpath = os.path.join(path, 'globaleaks-%d.db' % version)
+        dstpath = os.path.join(Settings.working_path, 'globaleaks.db')
+        shutil.copyfile(srcpath, dstpath)
+
+        self.assertNotEqual(update_db(), -1)
+
+        expected = {index.name for table in Base.metadata.sorted_tables for index in table.indexes}
+
+        connection = sqlite3.connect(dstpath)
+        existing = {x[0] for x in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        connection.close()
+
+        self.assertEqual(expected - existing, set())
+
+    def test_update_of_current_version(self):
+        return self._test(DATABASE_VERSION)
+
+    def test_migration_from_previous_version(self):
+        return self._test(DATABASE_VERSION - 1)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from twisted.trial import unittest
+
+from globaleaks.utils.boundedcache import BoundedCache
+
+
+class TestBoundedCache(unittest.TestCase):
+    def test_get_set(self):
+        cache = BoundedCache(2)
+
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.set('a', 1), 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIn('a', cache)
+
+        cache.pop('a')
+        self.assertNotIn('a', cache)
+
+    def test_eviction(self):
+        cache = BoundedCache(2)
+
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('a', 3)
+        self.assertEqual(len(cache), 2)
+
+        cache.set('c', 4)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.get('c'), 4)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_set(self):
+        cache = BoundedCache(8)
+
+        def fill(n):
+            for i in range(2000):
+                cache.set((n, i), i)
+
+        threads = [threading.Thread(target=fill, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(cache), 8)
+
+    def test_generation(self):
+        cache = BoundedCache(2)
+
+        generation = cache.generation
+        cache.set('a', 1, generation)
+        self.assertEqual(cache.get('a'), 1)
+
+        # a value computed before a clear() is not stored
+        generation = cache.generation
+        cache.clear()
+        self.assertEqual(cache.set('a', 2, generation), 2)
+        self.assertNotIn('a', cache)
+
+        cache.set('a', 3, cache.generation)
+        self.assertEqual(cache.get('a'), 3)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+import threading
+
+
+class BoundedCache(object):
+    """
+    A thread safe dictionary holding at most size entries;
+    when full, the oldest inserted entry is evicted first.
+
+    Every clear() starts a new generation: a value computed while the
+    cache was being cleared is discarded if set() is given the generation
+    read before computing it.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.generation = 0
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def set(self, key, value, generation=None):
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return value
+
+            if key not in self._data and len(self._data) >= self.size:
+                self._data.pop(next(iter(self._data), None), None)
+
+            self._data[key] = value
+
+        return value
+
+    def pop(self, key):
+        with self._lock:
+            return self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._data.clear()